@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections import deque
+from collections import deque, OrderedDict
+from queue import Empty, SimpleQueue
 from threading import Lock
-from typing import Deque, Iterable, List, Optional, Set, Tuple
-from itertools import islice
+from typing import Deque, Iterable, List, Tuple
+from itertools import islice, accumulate
+from bisect import bisect_right
 import time
 import string
 
@@ -39,12 +41,37 @@ SPLIT_CHARS_BEFORE = list("(<[{_$#@|~N")
 
 SPLIT_CHARS_ALL = SPLIT_CHARS_AFTER + SPLIT_CHARS_BEFORE
 SPLIT_CHARS_ALL_SET = set(SPLIT_CHARS_ALL)
+# Lower is preferred
+SPLIT_CHAR_PRIORITY = {char: ind for ind, char in enumerate(SPLIT_CHARS_ALL)}
+
+# Greedy wraps line by line as text arrives, optimal wraps whole paragraphs
+WRAP_GREEDY = "greedy"
+WRAP_OPTIMAL = "optimal"
+OPTIMAL_WRAP_PASSES = 3
+# Trailing lines of an open paragraph rebalanced when text is appended
+OPTIMAL_REOPEN_LINES = 8
 
 DIRTY = False
+FULL_REDRAW = True
+REWRAP_PENDING = False
+
+# Posted to wake the display thread while it waits for events
+WAKE_EVENT = pygame.event.custom_type()
+# Window contents may be lost and must be redrawn
+EXPOSE_EVENTS = {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED}
 
 font_objects = {}
 FONT_LOCK = Lock()
 
+# Discarded _Line objects kept for reuse while rewrapping
+LINE_POOL = deque()
+LINE_POOL_SIZE = 256
+
+# Rendered labels keyed by (pygame font id, text, color, highlight)
+LABEL_CACHE = OrderedDict()
+LABEL_CACHE_SIZE = 512
+LABEL_LOCK = Lock()
+
 SCROLL_AMOUNT = 1
 DRAG_DECELERATION = 35
 DRAG_FACTOR = 1
@@ -98,6 +125,38 @@ def _mark_dirty():
     DIRTY = True
 
 
+def _mark_full_redraw():
+    """Mark every textbox and the whole display to be redrawn."""
+    global FULL_REDRAW
+
+    FULL_REDRAW = True
+    _mark_dirty()
+
+
+def _wake_display(text_wrap=None):
+    """Wake the display thread to render changes made from another thread."""
+    if pygame.display.get_init():
+        try:
+            pygame.event.post(pygame.event.Event(WAKE_EVENT, text_wrap=text_wrap))
+        except pygame.error:
+            # Event queue is full, the display thread is already awake
+            pass
+
+
+def is_dirty() -> bool:
+    """Check if the display is marked to redraw."""
+    return DIRTY
+
+
+def is_animating() -> bool:
+    """Check if the display will change without any new events."""
+    for box in textboxes:
+        if box.text_wrap.is_coasting():
+            return True
+    # Held keys repeat
+    return isinstance(active_box, InputBox) and 1 in pygame.key.get_pressed()
+
+
 def _coast_scrolls():
     """Find textboxes which have coasting scrolls and perform scroll."""
 
@@ -108,7 +167,7 @@ def _coast_scrolls():
 def _check_held_keys():
     """Check for keys being held."""
 
-    if isinstance(active_box, type(None)):
+    if active_box is None:
         # No active box
         return
     if not isinstance(active_box, InputBox):
@@ -133,24 +192,63 @@ def _blink_cursor():
         return
 
     if active_box.blink_cursor():
-        _mark_dirty()
+        active_box.text_wrap.mark_dirty()
 
 
-def render(display: pygame.Surface, fill_color: Iterable[int] = None):
-    """Render every textbox if DIRTY."""
-    global DIRTY
+def render(
+    display: pygame.Surface, fill_color: Iterable[int] = None
+) -> List[pygame.Rect]:
+    """Render the textboxes marked dirty if DIRTY.
+
+    Returns
+    -------
+    List[pygame.Rect]
+        The areas of the display which were redrawn.
+
+    """
+    global DIRTY, FULL_REDRAW
 
     _coast_scrolls()
     _check_held_keys()
     _blink_cursor()
 
+    dirty_rects = []
     if DIRTY:
-        if not isinstance(fill_color, type(None)):
-            display.fill(fill_color)
+        _apply_rewrap()
+        display_rect = display.get_rect()
         with TEXTBOX_LOCK:
+            box_rects = {}
             for textbox in textboxes:
-                textbox.render(display)
+                # Include the border and indicators drawn along the edges
+                margin = 2 * (textbox.border_width + 2)
+                box_rect = pygame.Rect(textbox._get_rect(*get_dims(display)))
+                box_rect.inflate_ip(margin, margin)
+                box_rects[textbox] = box_rect.clip(display_rect)
+
+            if FULL_REDRAW:
+                if fill_color is not None:
+                    display.fill(fill_color)
+                for textbox in textboxes:
+                    textbox.render(display)
+                    textbox.text_wrap.dirty = False
+            else:
+                for textbox in [box for box in textboxes if box.text_wrap.dirty]:
+                    box_rect = box_rects[textbox]
+                    # Boxes overlapping the cleared area are redrawn within it
+                    display.set_clip(box_rect)
+                    if fill_color is not None:
+                        display.fill(fill_color)
+                    for other_box in textboxes:
+                        if box_rect.colliderect(box_rects[other_box]):
+                            other_box.render(display)
+                    textbox.text_wrap.dirty = False
+                    dirty_rects.append(box_rect)
+                display.set_clip(None)
+        if FULL_REDRAW:
+            dirty_rects = [display_rect]
+            FULL_REDRAW = False
         DIRTY = False
+    return dirty_rects
 
 
 def get_time():
@@ -159,15 +257,30 @@ def get_time():
 
 
 def _rewrap():
-    """Rewrap all textboxes."""
-    for textbox in textboxes:
-        with textbox.text_wrap.text_lock:
-            textbox.text_wrap.mark_wrap()
+    """Rewrap all textboxes when next rendered."""
+    global REWRAP_PENDING
+
+    REWRAP_PENDING = True
+    _mark_full_redraw()
+    # May be requested from another thread, e.g. by a font change
+    _wake_display()
+
+
+def _apply_rewrap():
+    """Rewrap all textboxes if a rewrap is pending."""
+    global REWRAP_PENDING
+
+    if REWRAP_PENDING:
+        REWRAP_PENDING = False
+        with TEXTBOX_LOCK:
+            for textbox in textboxes:
+                with textbox.text_wrap.text_lock:
+                    textbox.text_wrap.mark_wrap()
 
 
 def _resize_display(size: Iterable[int]) -> pygame.Surface:
     """Resize the display to the given size."""
-    _mark_dirty()
+    _mark_full_redraw()
     _rewrap()
     return pygame.display.set_mode(size, pygame.VIDEORESIZE)
 
@@ -181,13 +294,15 @@ def get_dims(display: pygame.Surface) -> Tuple[int]:
 def activate_box(box):
     """Set a textbox to active."""
     global active_box
+    # The cursor moves from the previous active box
+    for changed_box in (active_box, box):
+        if changed_box is not None:
+            changed_box.text_wrap.mark_dirty()
     active_box = box
     for box in textboxes:
         if isinstance(box, InputBox):
             box.reset_key_repeat()
 
-    _mark_dirty()
-
 
 def check_events(
     display: pygame.Surface, events: Iterable[pygame.event.Event]
@@ -195,11 +310,27 @@ def check_events(
     """Check pygame display events and execute accordingly."""
     global RUNNING
 
+    # Only the final size of a drag-resize needs applied
+    last_resize = None
+    for event in events:
+        if event.type == pygame.VIDEORESIZE:
+            last_resize = event
+
     for event in events:
         if event.type == pygame.QUIT:
             RUNNING = False
         elif event.type == pygame.VIDEORESIZE:
-            display = _resize_display(event.dict["size"])
+            if event is last_resize:
+                display = _resize_display(event.dict["size"])
+        elif event.type in EXPOSE_EVENTS:
+            _mark_full_redraw()
+        elif event.type == WAKE_EVENT:
+            # Changes may have arrived after their box was drawn this frame
+            text_wrap = event.dict.get("text_wrap")
+            if text_wrap is None:
+                _mark_dirty()
+            else:
+                text_wrap.mark_dirty()
         elif event.type == pygame.KEYUP:
             for box in textboxes:
                 if isinstance(box, InputBox):
@@ -213,7 +344,7 @@ def check_events(
             else:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     activate_box(None)
-        elif not isinstance(active_box, type(None)):
+        elif active_box is not None:
             active_box.handle_event(event, display)
 
         if event.type == pygame.MOUSEBUTTONUP:
@@ -227,41 +358,136 @@ def check_events(
     return display
 
 
-def get_font_repr(font_name: str, size: int, bold: bool, italic: bool):
-    """Return a string representation of the font object."""
-    return f"Font(font_name='{font_name}', size={size}, bold={bold}, italic={italic})"
+def get_font_repr(
+    font_name: str, size: int, bold: bool, italic: bool, assume_additive: bool = False
+):
+    """Return a string representation of the font object.
+
+    Examples
+    --------
+    >>> get_font_repr('courier new', 17, False, True)
+    "Font(font_name='courier new', size=17, bold=False, italic=True)"
+    >>> get_font_repr('courier new', 17, False, True, True)
+    "Font(font_name='courier new', size=17, bold=False, italic=True, assume_additive=True)"
+
+    """
+    font_repr = (
+        f"Font(font_name='{font_name}', size={size}, bold={bold}, italic={italic}"
+    )
+    if assume_additive:
+        # Fonts measured differently must not share a repr in font_objects
+        font_repr += ", assume_additive=True"
+    return font_repr + ")"
+
+
+def pack_color(color: Iterable[int]) -> int:
+    """Return any color accepted by pygame packed into an ARGB int.
+
+    Examples
+    --------
+    >>> hex(pack_color((255, 128, 0)))
+    '0xffff8000'
+    >>> hex(pack_color([0, 0, 255, 16]))
+    '0x100000ff'
+    >>> hex(pack_color("red")), hex(pack_color("#00ff00"))
+    ('0xffff0000', '0xff00ff00')
+
+    """
+    red, green, blue, alpha = pygame.Color(color)
+    return (alpha << 24) | (red << 16) | (green << 8) | blue
 
 
 class Font:
-    """Store all values relating to the display of Text."""
+    """Store all values relating to the display of Text.
+
+    Parameters
+    ----------
+    assume_additive
+        Measure text as the sum of memoized char widths. Exact for monospace
+        fonts, approximate for proportional fonts with kerning.
+
+    """
 
     def __init__(
-        self, font_name: str, size: int, bold: bool = False, italic: bool = False
+        self,
+        font_name: str,
+        size: int,
+        bold: bool = False,
+        italic: bool = False,
+        assume_additive: bool = False,
     ):
 
         self.font_name = font_name
         self.size = size
         self.bold = bold
         self.italic = italic
+        self.assume_additive = assume_additive
 
         self.pygame_font = None
+        self._char_w = {}
+        self._line_h = None
         self._create_pygame_font()
 
         with FONT_LOCK:
-            font_objects[repr(self)] = self
+            # Keep the first font registered if another thread raced to it
+            font_objects.setdefault(repr(self), self)
 
     def _create_pygame_font(self):
         """Create the pygame Font for blitting to Surfaces."""
         self.pygame_font = pygame.font.SysFont(
             self.font_name, self.size, self.bold, self.italic
         )
+        # Memoized measurements belong to the previous pygame font
+        self._char_w = {}
+        self._line_h = None
+        with LABEL_LOCK:
+            # The id of a discarded pygame font may be reused
+            LABEL_CACHE.clear()
 
     def get_pygame_font(self) -> pygame.font.Font:
         """Return a memoized pygame font created from the font."""
-        if isinstance(self.pygame_font, type(None)):
+        if self.pygame_font is None:
             self._create_pygame_font()
         return self.pygame_font
 
+    def get_char_width(self, char: str) -> int:
+        """Return the memoized width of a single char."""
+        width = self._char_w.get(char)
+        if width is None:
+            width = self.get_pygame_font().size(char)[0]
+            self._char_w[char] = width
+        return width
+
+    def _cache_char_widths(self, text: str):
+        """Memoize the widths of any chars in the text not yet measured."""
+        missing = set(text).difference(self._char_w)
+        if missing:
+            pygame_font = self.get_pygame_font()
+            for char in missing:
+                self._char_w[char] = pygame_font.size(char)[0]
+
+    def get_prefix_widths(self, text: str, initial: int = 0) -> List[int]:
+        """Return the widths of every prefix of the text from char widths.
+
+        Index i holds initial plus the width of text[:i].
+        """
+        self._cache_char_widths(text)
+        # Iterate within builtins rather than per char in Python
+        return list(accumulate(map(self._char_w.__getitem__, text), initial=initial))
+
+    def measure(self, text: str) -> Tuple[int]:
+        """Return the dimensions of the text in this font."""
+        if not self.assume_additive:
+            return self.get_pygame_font().size(text)
+        self._cache_char_widths(text)
+        return sum(map(self._char_w.__getitem__, text)), self.get_line_height()
+
+    def get_line_height(self) -> int:
+        """Return the memoized height of a line in this font."""
+        if self._line_h is None:
+            self._line_h = self.get_pygame_font().get_height()
+        return self._line_h
+
     def edit(
         self,
         font_name: str = None,
@@ -284,26 +510,33 @@ class Font:
         Font(font_name='courier new', size=20, bold=False, italic=True)
 
         """
-        global font_objects
         # Get either old or changed values
-        new_font_name = (
-            self.font_name if isinstance(font_name, type(None)) else font_name
-        )
-        new_size = self.size if isinstance(size, type(None)) else size
-        new_bold = self.bold if isinstance(bold, type(None)) else bold
-        new_italic = self.italic if isinstance(italic, type(None)) else italic
+        new_font_name = self.font_name if font_name is None else font_name
+        new_size = self.size if size is None else size
+        new_bold = self.bold if bold is None else bold
+        new_italic = self.italic if italic is None else italic
 
         # Check if font already exists
-        new_font_repr = get_font_repr(new_font_name, new_size, new_bold, new_italic)
-        if new_font_repr not in font_objects:
-            new_font = Font(new_font_name, new_size, new_bold, new_italic)
-            with FONT_LOCK:
-                font_objects[new_font_repr] = new_font
-        return font_objects[new_font_repr]
+        new_font_repr = get_font_repr(
+            new_font_name, new_size, new_bold, new_italic, self.assume_additive
+        )
+        with FONT_LOCK:
+            existing_font = font_objects.get(new_font_repr)
+        if existing_font is not None:
+            return existing_font
+
+        # Create outside the lock, the font registers itself
+        new_font = Font(
+            new_font_name, new_size, new_bold, new_italic, self.assume_additive
+        )
+        with FONT_LOCK:
+            return font_objects.setdefault(new_font_repr, new_font)
 
     def __repr__(self) -> str:
         """Return a string representation of the font object."""
-        return get_font_repr(self.font_name, self.size, self.bold, self.italic)
+        return get_font_repr(
+            self.font_name, self.size, self.bold, self.italic, self.assume_additive
+        )
 
     def __eq__(self, other) -> bool:
         """Compare the font object to another."""
@@ -312,13 +545,17 @@ class Font:
             size = self.size == other.size
             bold = self.bold == other.bold
             italic = self.italic == other.italic
-            return font_name and size and bold and italic
+            assume_additive = self.assume_additive == other.assume_additive
+            return font_name and size and bold and italic and assume_additive
         except AttributeError:
             return False
 
 
 class Text:
-    """Store text supporting fonts and colors."""
+    """Store text supporting fonts and colors.
+
+    Wrapped segments of the text are stored by the lines containing them.
+    """
 
     def __init__(
         self,
@@ -329,14 +566,16 @@ class Text:
         new_line: bool = False,
         label: str = None,
     ):
-        self.text_segment = text
         self.all_text = text
 
         self.font = font
         self.color = color
-        if isinstance(color, type(None)):
+        if color is None:
             self.color = DEFAULT_TEXT_COLOR
         self.highlight = highlight
+        # Hashable label cache keys even when colors are given as lists
+        self._color_packed = pack_color(self.color)
+        self._hl_packed = None if highlight is None else pack_color(highlight)
 
         self.new_line = new_line
         self.label = label
@@ -344,6 +583,8 @@ class Text:
         self.original_font_repr = repr(self.font)
         self.pos = None
 
+        self.prefix_widths = {}
+
     def set_pos(self, pos: Iterable[int]):
         """Set the Text's pos."""
         self.pos = pos
@@ -354,16 +595,7 @@ class Text:
         Line likely will need rewrapped.
         """
         self.all_text = text
-        self.text_segment = text
-
-    def reset_text(self):
-        """Reset the text's text_segment to the original, full string."""
-        self.text_segment = self.all_text
-
-    def set_text_segment(self, text_segment: Optional[str]):
-        """Set the text_segment until .reset_text() is called."""
-        if not isinstance(text_segment, type(None)):
-            self.text_segment = text_segment
+        self.prefix_widths.clear()
 
     def reset_font(self):
         """Reset the text's font to the original based.
@@ -383,18 +615,98 @@ class Text:
 
         """
         self.set_font(font_objects[self.original_font_repr])
-        _mark_dirty()
 
     def set_font(self, font: Font):
         """Set the Font to a new Font object."""
         width = self.get_size()[0]
         self.font = font
-        new_width = self.get_size(self.text_segment)[0]
+        new_width = self.get_size()[0]
         if width != new_width:
             _rewrap()
-        _mark_dirty()
+        else:
+            # The boxes containing the text are unknown
+            _mark_full_redraw()
+            _wake_display()
+
+    def _get_prefix_widths(self, text_segment: str) -> Tuple[List[int], int]:
+        """Return the memoized prefix widths of all_text and the segment offset.
+
+        Index offset + i holds the width of all_text[:offset + i]. Wrapped
+        segments are tails of all_text, so one list per font serves them all.
+        """
+        offset = self._get_tail_offset(text_segment)
+        if offset is None:
+            # Not a tail of the text, measure the segment alone
+            return self.font.get_prefix_widths(text_segment), 0
+        return self._get_all_prefix_widths(), offset
+
+    def _get_all_prefix_widths(self) -> List[int]:
+        """Return the memoized prefix widths of all_text in the current font."""
+        key = id(self.font)
+        widths = self.prefix_widths.get(key)
+        if widths is None:
+            widths = self.font.get_prefix_widths(self.all_text)
+            self.prefix_widths[key] = widths
+        return widths
+
+    def _get_tail_offset(self, text_segment: str) -> int:
+        """Return where text_segment starts if it ends all_text, else None."""
+        offset = len(self.all_text) - len(text_segment)
+        if offset < 0 or not self.all_text.startswith(text_segment, offset):
+            return None
+        return offset
+
+    def _fit_prefix(
+        self, text_segment: str, max_width: int, suffix: str = "", min_len: int = 0
+    ) -> int:
+        """Binary search for the longest prefix of text_segment which fits.
+
+        Parameters
+        ----------
+        text_segment
+            The section of text to fit.
+        max_width
+            The width in which the prefix (followed by suffix) must fit.
+        suffix
+            Text appended to each prefix when measuring (e.g. a dash).
+        min_len
+            The shortest prefix length to consider.
 
-    def _force_split(self, remaining_width: int, box_width: int) -> Tuple[str]:
+        Returns
+        -------
+        int
+            Length of the longest fitting prefix, or min_len - 1 if none fit.
+
+        """
+        if self.font.assume_additive:
+            widths, offset = self._get_prefix_widths(text_segment)
+            suffix_width = sum(map(self.font.get_char_width, suffix))
+            max_end_width = widths[offset] + max_width - suffix_width
+            return bisect_right(widths, max_end_width, offset + min_len) - 1 - offset
+
+        # Double the probe until it overflows so probes stay about a line long
+        length = len(text_segment)
+        low, high = min_len, max(min_len, 1)
+        while (
+            high < length
+            and self.get_size(text_segment[:high] + suffix)[0] <= max_width
+        ):
+            low = high + 1
+            high *= 2
+        high = min(high, length)
+        fit_len = low - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if self.get_size(text_segment[:mid] + suffix)[0] <= max_width:
+                fit_len = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        return fit_len
+
+    def _force_split(
+        self, remaining_width: int, box_width: int, text_segment: str
+    ) -> Tuple[str]:
         """Split at the location closest to the box border.
 
         Parameters
@@ -403,6 +715,8 @@ class Text:
             The amount of space remaining in which to fit a section of text.
         box_width
             The max width for a line.
+        text_segment
+            The section of text to split.
 
         Returns
         -------
@@ -412,29 +726,21 @@ class Text:
             The remaining text which must be added to a new line.
 
         """
-        best_ind = None
-        for ind in range(0, len(self.text_segment)):
-            segment = self.text_segment[: ind + 1] + "-"
-            segment_width = self.get_size(segment)[0]
-            if ind > 0:
-                best_ind = ind - 1
-            if segment_width > remaining_width:
-                if ind == 0 and remaining_width == box_width:
-                    # Single char does not fit on a line to itself
-                    self.text_segment = ""
-                break
-
-        if isinstance(best_ind, type(None)):
+        # Number of leading chars which fit alongside a trailing dash
+        fit_len = self._fit_prefix(text_segment, remaining_width, "-", 1)
+        if fit_len == 0 and remaining_width == box_width:
+            # Single char does not fit on a line to itself
+            return ("", "")
+
+        best_ind = min(fit_len, len(text_segment) - 1) - 1
+        if best_ind < 0:
             # Nothing fits on this line, put all on next
-            best_segment = ""
-            other_segment = self.text_segment
-        else:
-            best_segment = self.text_segment[: best_ind + 1] + "-"
-            other_segment = self.text_segment[best_ind + 1 :]
-        self.text_segment = best_segment
-        return (best_segment, other_segment)
+            return ("", text_segment)
+        return (text_segment[: best_ind + 1] + "-", text_segment[best_ind + 1 :])
 
-    def split(self, remaining_width: int, box_width: int) -> Tuple[str]:
+    def split(
+        self, remaining_width: int, box_width: int, text_segment: str = None
+    ) -> Tuple[str]:
         """Split at the optimal location.
 
         Parameters
@@ -443,6 +749,8 @@ class Text:
             The amount of space remaining in which to fit a section of text.
         box_width
             The max width for a line.
+        text_segment
+            The section of text to split. If None, split all of the text.
 
         Returns
         -------
@@ -464,54 +772,76 @@ class Text:
         ('aaa', '(bbbbb)')
 
         """
+        if text_segment is None:
+            text_segment = self.all_text
+
+        best_priority = len(SPLIT_CHARS_ALL)
+        best_segments = None
+        if remaining_width < box_width and "N" in SPLIT_CHAR_PRIORITY:
+            best_priority = SPLIT_CHAR_PRIORITY["N"]
+            best_segments = ("", text_segment)
+
+        if SPLIT_CHARS_ALL_SET.isdisjoint(text_segment):
+            # Nothing to search for, skip measuring the fitting prefix
+            if best_segments is None:
+                return self._force_split(remaining_width, box_width, text_segment)
+            return best_segments
 
-        def _split_chars_sort(char: Iterable[str]) -> int:
-            """Sort an Iterable of split chars."""
-            return SPLIT_CHARS_ALL.index(char)
-
-        possible_split_points = {}
-        if remaining_width < box_width and "N" in SPLIT_CHARS_ALL_SET:
-            possible_split_points["N"] = ("", self.text_segment)
-
-        for ind, char in enumerate(self.text_segment):
+        # Only chars within the fitting prefix need to be checked
+        fit_len = self._fit_prefix(text_segment, remaining_width)
+        last_ind = min(fit_len, len(text_segment) - 1)
+        for ind in range(last_ind, -1, -1):
+            char = text_segment[ind]
+            priority = SPLIT_CHAR_PRIORITY.get(char, best_priority)
+            if priority >= best_priority or char == "N":
+                # Not a split char or a later/preferred split was found
+                continue
             split_ind = ind
             if char in SPLIT_CHARS_AFTER_SET:
                 split_ind += 1
             elif ind == 0 and remaining_width == box_width:
                 # Cannot split before first char on a new_line
                 continue
-            text_segment = self.text_segment[:split_ind]
-            other_segment = self.text_segment[split_ind:]
-            text_segment_width = self.get_size(text_segment)[0]
+            if split_ind > fit_len:
+                # Outside remaining width
+                continue
+            best_priority = priority
+            best_segments = (text_segment[:split_ind], text_segment[split_ind:])
+            if not best_priority:
+                break  # No split char is preferred
 
-            if text_segment_width <= remaining_width:
-                if char in SPLIT_CHARS_ALL_SET and char != "N":
-                    possible_split_points[char] = (text_segment, other_segment)
-            else:
-                break  # Already outside remaining width
+        if best_segments is None:
+            return self._force_split(remaining_width, box_width, text_segment)
+        return best_segments
 
-        if possible_split_points:
-            split_chars_sorted = sorted(
-                possible_split_points.keys(), key=_split_chars_sort
-            )
-            best_split_char = split_chars_sorted[0]
-            best_segments = possible_split_points[best_split_char]
-            self.text_segment = best_segments[0]
-            return best_segments
-        return self._force_split(remaining_width, box_width)
-
-    def render(self, display: pygame.Surface):
+    def render(self, display: pygame.Surface, text_segment: str = None):
         """Render the text to the given display.
 
         Parameters
         ----------
-        split_section
-            If text contains a split, a section number must be provided.
+        text_segment
+            The section of text to render. If None, render all of the text.
 
         """
+        display.blit(self._get_label(text_segment), self.pos)
+
+    def _get_label(self, text_segment: str = None) -> pygame.Surface:
+        """Return the rendered text_segment, cached by its contents."""
+        if text_segment is None:
+            text_segment = self.all_text
         font = self.font.get_pygame_font()
-        label = font.render(self.text_segment, 1, self.color, self.highlight)
-        display.blit(label, self.pos)
+        key = (id(font), text_segment, self._color_packed, self._hl_packed)
+
+        with LABEL_LOCK:
+            label = LABEL_CACHE.get(key)
+            if label is None:
+                label = font.render(text_segment, 1, self.color, self.highlight)
+                LABEL_CACHE[key] = label
+                if len(LABEL_CACHE) > LABEL_CACHE_SIZE:
+                    LABEL_CACHE.popitem(last=False)
+            else:
+                LABEL_CACHE.move_to_end(key)
+        return label
 
     def get_size(self, text: str = None) -> Tuple[int]:
         """Return the dimensions of the text.
@@ -519,12 +849,18 @@ class Text:
         Parameters
         ----------
         text
-            text to determine the size of. If None, check self.text.
+            text to determine the size of. If None, check all of the text.
 
         """
-        if isinstance(text, type(None)):
-            text = self.text_segment
-        return self.font.get_pygame_font().size(text)
+        if text is None:
+            text = self.all_text
+        if self.font.assume_additive:
+            offset = self._get_tail_offset(text)
+            if offset is not None:
+                # Width of a wrapped tail is already summed by the prefix widths
+                widths = self._get_all_prefix_widths()
+                return widths[-1] - widths[offset], self.font.get_line_height()
+        return self.font.measure(text)
 
 
 class _Line:
@@ -540,6 +876,18 @@ class _Line:
 
         self.new_line = False
 
+        self.added_text = deque()
+
+    def _reset(self):
+        """Empty the line so that it may be reused."""
+        self.text_list.clear()
+        self.width = 0
+        self.height = 0
+        self.pos = None
+        self.text_segments.clear()
+        self.new_line = False
+        self.added_text.clear()
+
     def set_pos(self, pos: Tuple[int]):
         """Set the pos of the _Line."""
         self.pos = pos
@@ -560,7 +908,7 @@ class _Line:
         Returns
         -------
         Tuple[0]
-            Text added to the line.
+            Text added to the line. Reused by the next call.
         Tuple[1]
             Remaining segment of text.
 
@@ -579,26 +927,33 @@ class _Line:
             """Check if text still needs wrapped."""
             return box_text_list
 
-        added_text = deque()
+        added_text = self.added_text
+        added_text.clear()
         following_text_segment = ()
 
         while text_needs_wrapped() and not self.new_line:
             text = box_text_list.popleft()
             text_id = id(text)
 
+            text_segment = self.get_text_segment(text)
             if text in self.text_list:
                 # This should only occur if text object reached bottom
-                following_text_segment = (text_id, text.text_segment)
+                following_text_segment = (text_id, text_segment)
                 box_text_list.appendleft(text)
                 break
 
-            if text_id in self.text_segments:
-                text_segment = self.text_segments[text_id]
-                text.set_text_segment(text_segment)
-
-            text_width, text_height = text.get_size()
+            remaining_width = box_width - self.width
+            if len(text_segment) > remaining_width and (
+                text._fit_prefix(text_segment, remaining_width) < len(text_segment)
+            ):
+                # Chars are at least a pixel wide, probe about a line not all
+                fits_whole = False
+            else:
+                text_width, text_height = text.get_size(text_segment)
+                fits_whole = text_width <= remaining_width
 
-            if self.width + text_width <= box_width:
+            if fits_whole:
+                # Fits whole, no split needed
                 self.width += text_width
                 self.height = max(self.height, text_height)
                 self.text_list.append(text)
@@ -608,13 +963,11 @@ class _Line:
                     break
 
             else:
-                remaining_width = box_width - self.width
-
-                text_segments = text.split(remaining_width, box_width)
+                text_segments = text.split(remaining_width, box_width, text_segment)
                 if text_segments[0]:
                     self.text_segments[text_id] = text_segments[0]
 
-                    text_width, text_height = text.get_size()
+                    text_width, text_height = text.get_size(text_segments[0])
 
                     self.width += text_width
                     self.height = max(self.height, text_height)
@@ -629,11 +982,7 @@ class _Line:
 
     def get_text_segment(self, text):
         """Get the segment of a text object in this line."""
-        text_id = id(text)
-        if text_id in self.text_segments:
-            text_segment = self.text_segments[text_id]
-            return text_segment
-        return text.text_segment
+        return self.text_segments.get(id(text), text.all_text)
 
     def get_line_string(self):
         """Get the string of text stored by the line."""
@@ -643,18 +992,24 @@ class _Line:
         return string
 
     def render(self, display: pygame.Surface):
-        """Render the line to the display."""
-        text_x = 0
+        """Render the line to the display in a single batch of blits."""
+        blit_sequence = []
+        text_x = self.pos[0]
         for text in self.text_list:
-            text_segment = self.get_text_segment(text)
-            text.set_text_segment(text_segment)
-            text.set_pos((self.pos[0] + text_x, self.pos[1]))
-            text.render(display)
-            text_x += text.get_size()[0]
+            text.set_pos((text_x, self.pos[1]))
+            label = text._get_label(self.get_text_segment(text))
+            blit_sequence.append((label, text.pos))
+            text_x += label.get_width()
+
+        if hasattr(display, "fblits"):
+            display.fblits(blit_sequence)
+        else:
+            # Older pygame
+            display.blits(blit_sequence, doreturn=False)
 
     def get_rect(self):
         """Get the bounding rect for this line."""
-        if isinstance(self.pos, type(None)):
+        if self.pos is None:
             raise Exception("Line not yet rendered.")
         return [*self.pos, self.width, self.height]
 
@@ -697,6 +1052,23 @@ class _Line:
         return bool(self.text_list)
 
 
+def _get_line() -> _Line:
+    """Get an empty line, reusing a discarded one if possible."""
+    try:
+        return LINE_POOL.pop()
+    except IndexError:
+        return _Line()
+
+
+def _discard_lines(lines: Iterable[_Line]):
+    """Empty lines no longer in use and keep them for reuse."""
+    for line in lines:
+        if len(LINE_POOL) >= LINE_POOL_SIZE:
+            break
+        line._reset()
+        LINE_POOL.append(line)
+
+
 class _TextWrap:
     """Store wrapped text and handle wrapping."""
 
@@ -706,9 +1078,13 @@ class _TextWrap:
     #       Just take text objects from textbox and store reprs in file
     #       Textbox can then be recreated at this higher level from reprs in file
 
-    def __init__(self):
+    def __init__(self, wrap_mode: str = WRAP_GREEDY):
         self.wrapped_text_list = deque()
         self.new_text_list = deque()
+        # Added text not yet moved into new_text_list, safe without text_lock
+        self.incoming_text = SimpleQueue()
+
+        self.wrap_mode = wrap_mode
 
         self.current_height = 0
 
@@ -728,6 +1104,20 @@ class _TextWrap:
         self.drag_start_pos = None
 
         self.was_at_bottom = False
+        self.dirty = True
+
+    def mark_dirty(self):
+        """Mark the box of the text to be redrawn."""
+        self.dirty = True
+        _mark_dirty()
+
+    def _receive_text(self):
+        """Move added text into new_text_list. Requires text_lock."""
+        while True:
+            try:
+                self.new_text_list.append(self.incoming_text.get_nowait())
+            except Empty:
+                break
 
     def _next_line(self, force_new=False):
         """Get the next line to be filled."""
@@ -735,7 +1125,7 @@ class _TextWrap:
             line = self.lines.pop()
             self.current_height -= line.height
         else:
-            line = _Line()
+            line = _get_line()
         return line
 
     def _wrap_new_lines(self, all_=False, force_new_line=False):
@@ -756,12 +1146,16 @@ class _TextWrap:
             """Check if the current wrapped lines are shorter than height of box."""
             return self.current_height < self.pos[3]
 
+        self._receive_text()
         lines_added = 0
 
         if text_needs_wrapped() and (all_ or within_height()):
-            assert not isinstance(self.pos, type(None))
+            assert self.pos is not None
 
             box_width = self.pos[2]
+            if self.wrap_mode == WRAP_OPTIMAL:
+                return self._wrap_knuth_plass(box_width, all_)
+
             line = self._next_line(force_new_line)
 
             new_text_segment = None
@@ -808,19 +1202,24 @@ class _TextWrap:
                             new_text_segment = ()
 
                         line.text_segments.clear()
-                    line.text_list.reverse()
-                    self.new_text_list.extendleft(line.text_list)
-                    self._purge_segments([self.new_text_list], False)
+                    self._requeue_text(line.text_list)
+                    _discard_lines([line])
                     break
 
+                if (
+                    added_text
+                    and self.wrapped_text_list
+                    and added_text[0] is self.wrapped_text_list[-1]
+                ):
+                    # Text split from the previous line
+                    self.wrapped_text_list.pop()
                 self.wrapped_text_list.extend(added_text)
-                self._purge_segments([self.wrapped_text_list], False)
                 self.lines.append(line)
                 lines_added += 1
                 if len(self.lines) >= self.line_num:
                     self.current_height += line.height
 
-                line = _Line()
+                line = _get_line()
 
                 if new_text_segment:
                     if new_text_segment[0] not in self.remaining_segments:
@@ -830,31 +1229,313 @@ class _TextWrap:
                         line.text_segments[text_id] = text_segment
         return lines_added
 
-    def _purge_segments(self, lists=None, reset_segment=True):
-        """Clear split segments."""
+    def _wrap_knuth_plass(self, box_width: int, all_=False) -> int:
+        """Wrap whole paragraphs into lines with the least total slack.
+
+        A paragraph is a run of text ending with a new_line Text.
 
-        def _purge_segments_from_list(text_list: Deque, used_text_ids: Set):
-            """Clear split segments from the given list in place."""
-            checked_text_list = deque()
-            while text_list:
-                text = text_list.pop()
-                text_id = id(text)
-                if text_id not in used_text_ids:
-                    checked_text_list.appendleft(text)
-                    used_text_ids.add(text_id)
-                    if reset_segment:
-                        text.reset_text()
+        Parameters
+        ----------
+        box_width
+            The max width for a line.
+        all_
+            Force wrap all paragraphs even if they don't fit on screen.
 
-            text_list.extend(checked_text_list)
+        Returns
+        -------
+        int
+            The number of lines added, counting the previous final line.
 
-        used_text_ids = set()
+        """
+        lines_before = len(self.lines)
+        # A paragraph left open by the previous wrap must be wrapped again
+        reopened = self._reopen_paragraph()
 
-        if isinstance(lists, type(None)):
-            _purge_segments_from_list(self.wrapped_text_list, used_text_ids)
-            _purge_segments_from_list(self.new_text_list, used_text_ids)
-        else:
-            for list_ in lists:
-                _purge_segments_from_list(list_, used_text_ids)
+        while self.new_text_list and (
+            reopened or all_ or self.current_height < self.pos[3]
+        ):
+            reopened = False
+            paragraph = []
+            while self.new_text_list:
+                text = self.new_text_list.popleft()
+                paragraph.append(text)
+                if text.new_line:
+                    break
+
+            for line in self._break_paragraph(paragraph, box_width):
+                self.lines.append(line)
+                if len(self.lines) >= self.line_num:
+                    self.current_height += line.height
+            self.wrapped_text_list.extend(paragraph)
+        # Rebuilt lines of a reopened paragraph were not added
+        lines_added = len(self.lines) - lines_before
+        if lines_before:
+            # Count the final line as rebuilt, as greedy wrapping does
+            lines_added += 1
+        return max(lines_added, 0)
+
+    def _reopen_paragraph(self) -> bool:
+        """Move the end of the final paragraph back to be wrapped if it has no new_line.
+
+        At least OPTIMAL_REOPEN_LINES lines are reopened, continuing back until
+        a line starting with a whole Text so earlier lines can be kept.
+        """
+        if not self.lines or self.lines[-1].new_line:
+            return False
+
+        text_ids = set()
+        reopened_lines = []
+        while self.lines and not self.lines[-1].new_line:
+            line = self.lines.pop()
+            reopened_lines.append(line)
+            text_ids.update(map(id, line))
+            if (
+                len(reopened_lines) >= OPTIMAL_REOPEN_LINES
+                and line.text_list
+                and self.lines
+                and id(line.text_list[0]) not in self.lines[-1]
+            ):
+                # Line does not continue a Text from the kept lines
+                break
+        _discard_lines(reopened_lines)
+        while self.wrapped_text_list and id(self.wrapped_text_list[-1]) in text_ids:
+            self.new_text_list.appendleft(self.wrapped_text_list.pop())
+        self.calculate_height()
+        return True
+
+    def _get_paragraph_start(self, line_num: int) -> int:
+        """Get the first line num of the paragraph containing the line."""
+        line_num = min(line_num, len(self.lines))
+        while line_num > 0 and not self.lines[line_num - 1].new_line:
+            line_num -= 1
+        return line_num
+
+    def _break_paragraph(self, paragraph: List[Text], box_width: int) -> List[_Line]:
+        """Split a paragraph into lines minimizing the sum of squared slack.
+
+        Every char is a possible break followed by a dash, but split chars
+        and the ends of Text objects are preferred by penalizing the rest.
+        An overlong line is only allowed if nothing smaller can be made.
+
+        """
+        # Flatten the paragraph into cumulative char widths
+        chars = "".join(text.all_text for text in paragraph)
+        widths = [0]
+        starts = []
+        owners = []
+        for text_num, text in enumerate(paragraph):
+            starts.append(len(owners))
+            text_widths = text.font.get_prefix_widths(text.all_text, widths[-1])
+            widths.extend(islice(text_widths, 1, None))
+            owners.extend([text_num] * len(text.all_text))
+        length = len(chars)
+
+        if not length:
+            line = self._build_line(paragraph, starts, 0, 0, False)
+            line.new_line = paragraph[-1].new_line
+            return [line]
+
+        # Map break positions to whether a dash must be added
+        breaks = {length: False}
+        for start in starts[1:]:
+            if start < length:
+                breaks[start] = False
+        for ind, char in enumerate(chars):
+            if char in SPLIT_CHARS_AFTER_SET:
+                breaks[ind + 1] = False
+            elif char in SPLIT_CHARS_ALL_SET and char != "N" and ind > 0:
+                breaks[ind] = False
+        for ind in range(1, length):
+            breaks.setdefault(ind, True)
+
+        positions = [0] + sorted(breaks)
+        dash_widths = [0] * len(positions)
+        for position_num, position in enumerate(positions):
+            if breaks.get(position):
+                font = paragraph[owners[position - 1]].font
+                dash_widths[position_num] = font.get_char_width("-")
+
+        # Char widths ignore kerning, so narrow the target until lines fit
+        target_width = box_width
+        lines = []
+        for _ in range(OPTIMAL_WRAP_PASSES):
+            # Lines from a previous pass overflowed
+            _discard_lines(lines)
+            lines = []
+            overflow = 0
+            line_breaks = self._find_breaks(
+                positions, widths, dash_widths, target_width
+            )
+            for start_num, end_num in line_breaks:
+                start, end = positions[start_num], positions[end_num]
+                line = self._build_line(paragraph, starts, start, end, breaks[end])
+                if end_num - start_num > 1:
+                    # Lines of a single break could not be made narrower
+                    overflow = max(overflow, line.width - box_width)
+                lines.append(line)
+            if overflow <= 0 or overflow >= target_width:
+                break
+            target_width -= overflow
+
+        if overflow > 0:
+            # Passes ran out, split lines still overflowing by measured width
+            fitted_lines = []
+            for (start_num, end_num), line in zip(line_breaks, lines):
+                if line.width <= box_width or end_num - start_num == 1:
+                    fitted_lines.append(line)
+                    continue
+                _discard_lines([line])
+                while start_num < end_num:
+                    fit_num = self._fit_line(
+                        paragraph,
+                        starts,
+                        positions,
+                        breaks,
+                        start_num,
+                        end_num,
+                        box_width,
+                    )
+                    start, end = positions[start_num], positions[fit_num]
+                    fitted_lines.append(
+                        self._build_line(paragraph, starts, start, end, breaks[end])
+                    )
+                    start_num = fit_num
+            lines = fitted_lines
+
+        lines[-1].new_line = paragraph[-1].new_line
+        return lines
+
+    def _fit_line(
+        self,
+        paragraph: List[Text],
+        starts: List[int],
+        positions: List[int],
+        breaks: dict,
+        start_num: int,
+        end_num: int,
+        box_width: int,
+    ) -> int:
+        """Return the furthest break up to end_num whose line measures to fit.
+
+        The break following start_num is used if no line fits.
+        """
+        fit_num = start_num + 1
+        low, high = start_num + 2, end_num
+        while low <= high:
+            mid = (low + high) // 2
+            start, end = positions[start_num], positions[mid]
+            line = self._build_line(paragraph, starts, start, end, breaks[end])
+            fits = line.width <= box_width
+            _discard_lines([line])
+            if fits:
+                fit_num = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        return fit_num
+
+    def _find_breaks(
+        self,
+        positions: List[int],
+        widths: List[int],
+        dash_widths: List[int],
+        box_width: int,
+    ) -> List[Tuple[int]]:
+        """Find the breaks minimizing the total cost of the lines.
+
+        Parameters
+        ----------
+        positions
+            Char positions at which a line may end, starting with 0.
+        widths
+            Cumulative char widths of the paragraph.
+        dash_widths
+            Width of the dash added when breaking at each position.
+        box_width
+            The max width for a line.
+
+        Returns
+        -------
+        List[Tuple[int]]
+            The start and end indices into positions for each line.
+
+        """
+        forced_penalty = box_width**2
+        final = positions[-1]
+        costs = [0]
+        previous = [0]
+        for end_num in range(1, len(positions)):
+            end = positions[end_num]
+            dash_width = dash_widths[end_num]
+
+            best_cost, best_start = None, None
+            for start_num in range(end_num - 1, -1, -1):
+                width = widths[end] - widths[positions[start_num]] + dash_width
+                if width > box_width:
+                    if start_num < end_num - 1:
+                        break  # Earlier starts are only wider
+                    cost = 2 * forced_penalty
+                elif end == final:
+                    cost = 0  # Final line may be short
+                else:
+                    cost = (box_width - width) ** 2
+                if dash_width:
+                    cost += forced_penalty
+                cost += costs[start_num]
+                if best_cost is None or cost < best_cost:
+                    best_cost, best_start = cost, start_num
+            costs.append(best_cost)
+            previous.append(best_start)
+
+        line_breaks = deque()
+        end_num = len(positions) - 1
+        while end_num > 0:
+            line_breaks.appendleft((previous[end_num], end_num))
+            end_num = previous[end_num]
+        return list(line_breaks)
+
+    def _build_line(
+        self,
+        paragraph: List[Text],
+        starts: List[int],
+        start: int,
+        end: int,
+        dashed: bool,
+    ) -> _Line:
+        """Create a line from the paragraph chars between start and end."""
+        line = _get_line()
+        length = starts[-1] + len(paragraph[-1].all_text)
+        for text, text_start in zip(paragraph, starts):
+            text_end = text_start + len(text.all_text)
+            if text_start == text_end:
+                # Empty text belongs to the line it starts on
+                if not (start <= text_start < end or text_start == end == length):
+                    continue
+            elif text_end <= start or text_start >= end:
+                continue
+
+            segment_start = max(start, text_start) - text_start
+            segment = text.all_text[segment_start : end - text_start]
+            if dashed and text_start < end <= text_end:
+                segment += "-"
+            text_width, text_height = text.get_size(segment)
+            line.width += text_width
+            line.height = max(line.height, text_height)
+            line.text_list.append(text)
+            line.text_segments[id(text)] = segment
+        return line
+
+    def _requeue_text(self, text_list: Iterable[Text]):
+        """Move text back to the front of new_text_list to be wrapped.
+
+        Text split from the front of new_text_list is only kept once.
+        """
+        text_list = list(text_list)
+        if text_list and self.new_text_list:
+            if text_list[-1] is self.new_text_list[0]:
+                text_list.pop()
+        text_list.reverse()
+        self.new_text_list.extendleft(text_list)
 
     def _find_segment_index(self, text_obj):
         """Find the index of the end of the text_obj after mark_wrap."""
@@ -891,15 +1572,18 @@ class _TextWrap:
         if start_line > 0:
             # Rewrap previous line in case it is affected
             start_line -= 1
+        if self.wrap_mode == WRAP_OPTIMAL:
+            # Paragraphs are only wrapped as a whole
+            start_line = self._get_paragraph_start(start_line)
 
         self._stop_coast()
-        purged_line_list = None
+        self.mark_dirty()
         purged_lines = []
         if start_line == 0:
+            _discard_lines(self.lines)
             self.lines.clear()
         else:
             purged_lines = list(islice(self.lines, start_line, None))
-            purged_line_list = [line.text_list for line in purged_lines]
             self.lines = list(islice(self.lines, 0, start_line))
         self.line_num = max(0, min(len(self.lines) - 1, self.line_num))
         self.calculate_height()
@@ -918,7 +1602,7 @@ class _TextWrap:
         old_text = []
         start_ind = None
         for text_num, text in enumerate(self.wrapped_text_list):
-            if isinstance(start_ind, type(None)):
+            if start_ind is None:
                 for line in purged_lines:
                     if id(text) in line:
                         start_ind = text_num
@@ -929,17 +1613,12 @@ class _TextWrap:
 
         if not old_text:
             old_text = self.wrapped_text_list
-        old_text.reverse()
-        if not isinstance(purged_line_list, type(None)):
-            self._purge_segments(purged_line_list)
-        else:
-            self._purge_segments()
-        self.new_text_list.extendleft(old_text)
-        if not isinstance(start_ind, type(None)):
+        self._requeue_text(old_text)
+        if start_ind is not None:
             self.wrapped_text_list = deque(islice(self.wrapped_text_list, 0, start_ind))
         else:
             self.wrapped_text_list.clear()
-        self._purge_segments()
+        _discard_lines(purged_lines)
 
     def get_box_string(self):
         """Get all text in box as a string."""
@@ -953,22 +1632,30 @@ class _TextWrap:
 
     def add_text(self, text_list: Iterable[Text]):
         """Add text to the current input."""
-        with self.text_lock:
-            self.new_text_list.extend(text_list)
-        _mark_dirty()
+        for text in text_list:
+            self.incoming_text.put(text)
+        self.mark_dirty()
+        _wake_display(self)
 
     def get_labeled_text(self, label):
         """Get all text with given label.
 
         Make sure to rewrap and mark dirty.
         """
+        with self.text_lock:
+            self._receive_text()
+            return self._get_labeled_text(label)
+
+    def _get_labeled_text(self, label):
+        """Get all text with given label. Requires text_lock."""
         all_text = self.wrapped_text_list + self.new_text_list
         return list(filter(lambda x: x.label == label, all_text))
 
     def change_text(self, label, string):
         """Change all text objects with the given label to the new text."""
         with self.text_lock:
-            affected_text = self.get_labeled_text(label)
+            self._receive_text()
+            affected_text = self._get_labeled_text(label)
             for text in affected_text:
                 text.change_text(string)
             first_changed = affected_text[0]
@@ -978,7 +1665,8 @@ class _TextWrap:
                     line_num = _line_num
                     break
             self.mark_wrap(line_num)
-        _mark_dirty()
+        self.mark_dirty()
+        _wake_display(self)
 
     def _get_lines(self):
         """Return a deque of the current lines from scroll."""
@@ -1009,7 +1697,7 @@ class _TextWrap:
             # Ensure we don't scroll past the last line
             self.scroll_lines(to_scroll)
         self.calculate_height()
-        _mark_dirty()
+        self.mark_dirty()
 
     def _stop_coast(self):
         """Stop coasting."""
@@ -1018,12 +1706,16 @@ class _TextWrap:
         self.dragged_lines = 0
         self.drags_to_go = 0
 
+    def is_coasting(self) -> bool:
+        """Check if a scroll is continuing from a drag."""
+        # Only coast if already are or above deadzone
+        return bool(self.drag_speed) and (
+            abs(self.drag_speed) > DRAG_DEADZONE or bool(self.drags_to_go)
+        )
+
     def coast_scroll(self):
         """Continue a scroll based on current drag speed."""
-        if self.drag_speed and (
-            abs(self.drag_speed) > DRAG_DEADZONE or self.drags_to_go
-        ):
-            # Only coast if already are or above deadzone
+        if self.is_coasting():
             current_time = get_time()
             time_diff = current_time - self.drag_end_time
             self.drags_to_go += self.drag_speed * time_diff
@@ -1044,7 +1736,7 @@ class _TextWrap:
 
     def end_drag(self):
         """Calculate and set drag speed."""
-        if not isinstance(self.drag_start_time, type(None)):
+        if self.drag_start_time is not None:
             time_diff = get_time() - self.drag_start_time
             if time_diff:
                 self.drag_speed = (self.dragged_lines / time_diff) * DRAG_FACTOR
@@ -1085,12 +1777,13 @@ class _TextWrap:
     def clear_all_text(self):
         """Clear all text that has been added to the box."""
         with self.text_lock:
+            _discard_lines(self.lines)
             self.lines.clear()
             self.current_height = 0
             self.wrapped_text_list.clear()
+            self._receive_text()
             self.new_text_list.clear()
         _rewrap()
-        _mark_dirty()
 
     def render(self, display: pygame.Surface, pos: List[int]):
         """Render the lines of text."""
@@ -1124,17 +1817,23 @@ class TextBox:
     pins
         Percentages which correspond to the corners of the box relative to
         the display's resolution
+    wrap_mode
+        WRAP_GREEDY to fill each line as text arrives, or WRAP_OPTIMAL to
+        balance the lines of each paragraph. Optimal wrapping breaks a whole
+        paragraph at once, even past the bottom of the box, in time growing
+        with its length. Text appended to an open paragraph only rebalances
+        its last OPTIMAL_REOPEN_LINES lines.
 
     """
 
-    def __init__(self, pins: Iterable[int]):
+    def __init__(self, pins: Iterable[int], wrap_mode: str = WRAP_GREEDY):
         self.pins = pins  # LONGTERM: Support fixed-width/height
         self.border_width = DEFAULT_BORDER_WIDTH
         self.border_color = DEFAULT_BORDER_COLOR
 
         self.indicator_color = DEFAULT_INDICATOR_COLOR
 
-        self.text_wrap = _TextWrap()
+        self.text_wrap = _TextWrap(wrap_mode)
 
         self.pos = None
 
@@ -1196,7 +1895,7 @@ class TextBox:
 
             elif event.type == pygame.MOUSEMOTION:
                 # Drag
-                if not isinstance(self.text_wrap.drag_start_time, type(None)):
+                if self.text_wrap.drag_start_time is not None:
                     if self.text_wrap.scroll_drag(
                         self.text_wrap.drag_start_pos, event.pos
                     ):
@@ -1303,12 +2002,12 @@ class InputBox(TextBox):
     def insert_char(self, char):
         """Insert a given char at the cursor."""
         char = _check_char(char)
-        if isinstance(char, type(None)):
+        if char is None:
             return
 
         with self.text_wrap.text_lock:
             returns = self._update_cursor_pos()
-            if isinstance(returns, type(None)):
+            if returns is None:
                 return
             line_num, text_obj, index = returns
             all_text = text_obj.all_text
@@ -1333,7 +2032,7 @@ class InputBox(TextBox):
             elif char != "delete":
                 self._update_cursor_pos()
                 self.move_cursor_chars(1)
-        _mark_dirty()
+        self.text_wrap.mark_dirty()
 
     def move_cursor_direction(self, direction):
         """Move the cursor a given direction.
@@ -1346,7 +2045,7 @@ class InputBox(TextBox):
 
         """
         with self.text_wrap.text_lock:
-            if isinstance(self.cursor_rect, type(None)):
+            if self.cursor_rect is None:
                 return
             if not self.text_wrap.lines:
                 return
@@ -1367,7 +2066,7 @@ class InputBox(TextBox):
 
     def reset_key_repeat(self, key=None):
         """Reset the key repeats."""
-        if isinstance(key, type(None)):
+        if key is None:
             self.key_press_times.clear()
             self.key_repeats.clear()
         else:
@@ -1511,7 +2210,7 @@ class InputBox(TextBox):
                     break
 
             self.cursor_rect = [x_pos, y_pos, DEFAULT_CURSOR_WIDTH, height]
-            _mark_dirty()
+            self.text_wrap.mark_dirty()
             break
         return line_num, text_obj, sub_index
 
@@ -1569,7 +2268,7 @@ class InputBox(TextBox):
 
     def _update_cursor_index(self):
         """Determine where the cursor's index is based on it's position."""
-        if isinstance(self.cursor_rect, type(None)):
+        if self.cursor_rect is None:
             return
 
         point = self.cursor_rect[:2]
@@ -1638,7 +2337,7 @@ class InputBox(TextBox):
         self._update_cursor_index()
 
         if not self.cursor_blinked:
-            if not isinstance(self.cursor_rect, type(None)):
+            if self.cursor_rect is not None:
                 box_rect = self._get_rect(*get_dims(display))
                 cursor_rect = self.cursor_rect[:]
                 cursor_rect[0] += box_rect[0]
@@ -10,6 +10,7 @@ import pygame
 
 # Constants
 RESOLUTION = (500, 500)
+WAIT_TIMEOUT = 100  # Max millis to wait for an event when idle
 
 
 def _interface_loop():
@@ -20,15 +21,24 @@ def _interface_loop():
 
     while get_running():
         # Render display
-        render(display, (0, 0, 0))
+        dirty_rects = render(display, (0, 0, 0))
+        if dirty_rects:
+            # Only copy the redrawn areas to the screen
+            pygame.display.update(dirty_rects)
 
         # Handle events
-        events = pygame.event.get()
+        if interface.display.is_dirty():
+            events = pygame.event.get()
+        elif interface.display.is_animating():
+            sleep(interface.display.TICK)
+            events = pygame.event.get()
+        else:
+            # Sleep until an event arrives, waking to blink the cursor
+            event = pygame.event.wait(WAIT_TIMEOUT)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
         display = interface.display.check_events(display, events)
 
-        pygame.display.flip()
-        sleep(.00001)
-
 
 def init():
     """Create the display and handle all related functionality."""